@@ -20,7 +20,7 @@ rsync -avz --delete --dry-run \
       --exclude='.gitignore' \
       --exclude='node_modules' \
       --exclude='.env' \
-      --exclude='*.sqlite3' \
+      --exclude='*.sqlite3*' \
       --filter=':- .gitignore' \
       -e "ssh -o RemoteCommand=none" \
       $LOCAL_DIR/ $REMOTE_USER@$REMOTE_HOST:$REMOTE_DIR/
@@ -0,0 +1,30 @@
+"""Shared HTTP session with connection pooling and retries."""
+from __future__ import annotations
+
+from functools import lru_cache
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+@lru_cache(maxsize=1)
+def get_session() -> requests.Session:
+    """Return a process-wide session so TLS connections are reused across calls."""
+
+    retry = Retry(
+        total=3,
+        # Never re-send after a read timeout: it reraises as ReadTimeout so the LLM fallback
+        # kicks in promptly, and a slow provider is not asked (and billed) for the same generation again.
+        read=False,
+        backoff_factor=0.5,
+        backoff_jitter=0.5,  # Spread retries out so clients don't retry in lockstep.
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["GET", "POST"],
+        raise_on_status=False,  # Let callers' raise_for_status() surface the real HTTP error.
+    )
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=20, max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
@@ -2,22 +2,41 @@
 from __future__ import annotations
 
 import hashlib
-import json
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any, Dict, Optional
 
+import orjson
 import requests
 
 from ..core.settings import AppSettings
+from .http import get_session
 
+_THINK_RE = re.compile(r"<think>.*?</think>", re.DOTALL)
+# Optional "temperature:" preamble and/or opening code fence; always matches.
+_WRAPPER_RE = re.compile(r"(?:temperature:\s*)?(?:```(?:json)?\s*)?")
 
-def _make_cache_key(context: Any, system_prompt: str, model: str) -> str:
-    """Build a stable cache key for LLM requests by hashing long inputs."""
-    context_str = context if isinstance(context, str) else json.dumps(context, sort_keys=True)
-    combined = f"{context_str}||{system_prompt}||{model}"
-    key_hash = hashlib.sha256(combined.encode()).hexdigest()[:16]
-    return f"llm_{key_hash}"
+
+@lru_cache(maxsize=32)
+def _prompt_hash(system_prompt: str) -> str:
+    """Hash the (usually static) system prompt once instead of on every request."""
+    return hashlib.blake2b(system_prompt.encode(), digest_size=16).hexdigest()
+
+
+def _context_hash(context: Any) -> str:
+    """Hash the LLM context, serializing dicts canonically first."""
+    if isinstance(context, str):
+        context_bytes = context.encode()
+    else:
+        context_bytes = orjson.dumps(context, option=orjson.OPT_SORT_KEYS)
+    return hashlib.blake2b(context_bytes, digest_size=16).hexdigest()
+
+
+def _make_cache_key(context_hash: str, prompt_hash: str, model: str) -> str:
+    """Combine precomputed input digests into a short cache key."""
+    combined = f"{context_hash}||{prompt_hash}||{model}"
+    return f"llm_{hashlib.blake2b(combined.encode(), digest_size=8).hexdigest()}"
 
 
 @dataclass(slots=True)
@@ -27,6 +46,7 @@ class LLMClient:
     settings: AppSettings
     cache: Optional[Any] = None  # diskcache.Cache, but typed loosely for testing ease
     cache_ttl_seconds: int = 600
+    session: requests.Session = field(default_factory=get_session)
 
     def generate(
         self,
@@ -40,16 +60,20 @@ class LLMClient:
 
         self.settings.require_llm_configured()
         cache_keys = []
-        if self.cache:
+        if self.cache is not None:
+            # Hash the inputs once; each per-model key is then a cheap combine.
+            context_hash = _context_hash(context)
+            prompt_hash = _prompt_hash(system_prompt)
             model = model_override or self.settings.llm_model or "unknown"
-            primary_key = _make_cache_key(context, system_prompt, model)
-            cache_keys.append(primary_key)
+            cache_keys.append(_make_cache_key(context_hash, prompt_hash, model))
             if not model_override and self.settings.has_fallback_llm():
                 fallback_model = self.settings.fallback_llm_model or "unknown"
-                cache_keys.append(_make_cache_key(context, system_prompt, fallback_model))
+                cache_keys.append(_make_cache_key(context_hash, prompt_hash, fallback_model))
             for key in cache_keys:
                 cached = self.cache.get(key)
                 if cached is not None:
+                    # Sliding expiry: LLM calls are the costly refill, so keep hot entries alive.
+                    self.cache.touch(key, expire=self.cache_ttl_seconds)
                     return cached
 
         try:
@@ -77,9 +101,9 @@ class LLMClient:
                     f"Primary LLM failed ({exc!r}) and fallback also failed ({fallback_exc!r})."
                 ) from exc
 
-        if self.cache:
+        if self.cache is not None:
             model_used = result.get("_model_used") or "unknown"
-            cache_key = _make_cache_key(context, system_prompt, model_used)
+            cache_key = _make_cache_key(context_hash, prompt_hash, model_used)
             self.cache.set(cache_key, result, expire=self.cache_ttl_seconds)
         return result
 
@@ -114,11 +138,12 @@ class LLMClient:
 
         payload = {
             "model": model,
+            # Static system prompt goes first so providers' automatic prefix caching can reuse it.
             "messages": [
                 {"role": "system", "content": system_prompt},
                 {
                     "role": "user",
-                    "content": context if isinstance(context, str) else json.dumps(context),
+                    "content": context if isinstance(context, str) else orjson.dumps(context).decode(),
                 },
             ],
             "stream": False,
@@ -126,24 +151,24 @@ class LLMClient:
         if supports_json_mode:
             payload["response_format"] = {"type": "json_object"}
 
-        response = requests.post(
+        response = self.session.post(
             api_url,
             headers={
                 "Authorization": f"Bearer {api_key}",
                 "Content-Type": "application/json",
             },
-            json=payload,
+            data=orjson.dumps(payload),
             timeout=200,
         )
         response.raise_for_status()
-        data = response.json()
+        data = orjson.loads(response.content)
         choices = data.get("choices") or []
         if not choices:
             raise ValueError("LLM response did not include choices")
 
         raw_content = choices[0]["message"]["content"]
         content = self._normalise_content(raw_content)
-        parsed = json.loads(content)
+        parsed = orjson.loads(content)
         parsed["_raw_llm_response"] = raw_content
         parsed["_model_used"] = model
         parsed["_provider_label"] = provider_label
@@ -154,13 +179,9 @@ class LLMClient:
         """Strip provider-specific wrappers around JSON output."""
 
         content = raw_content.strip()
-        content = re.sub(r"<think>.*?</think>", "", content, flags=re.DOTALL).strip()
-        if content.startswith("temperature:"):
-            content = content.split("temperature:", 1)[1].strip()
-        if content.startswith("```json"):
-            content = content[7:]
-        elif content.startswith("```"):
-            content = content[3:]
+        if "<think>" in content:
+            content = _THINK_RE.sub("", content).strip()
+        content = content[_WRAPPER_RE.match(content).end():]
         if content.endswith("```"):
             content = content[:-3]
         return content.strip()
@@ -1,13 +1,31 @@
 """OpenWeatherMap client with optional caching."""
 from __future__ import annotations
 
-from dataclasses import dataclass
-from datetime import datetime, timedelta
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta
+from functools import lru_cache
 from typing import Any, Dict, Optional
 
+import orjson
 import requests
 
 from ..core.settings import AppSettings
+from .http import get_session
+
+# Yesterday's noon reading never changes and its key embeds the date, so keep it for a day.
+_YESTERDAY_TTL_SECONDS = 24 * 60 * 60
+
+
+@lru_cache(maxsize=8)
+def _format_day(timestamp: int) -> str:
+    """Format a timemachine timestamp as a date; yesterday's dt repeats all day."""
+    return datetime.fromtimestamp(timestamp).strftime("%A, %B %d")
+
+
+@lru_cache(maxsize=2)
+def _yesterday_noon_timestamp(today: date) -> int:
+    """Return yesterday at local noon; constant per day so it keeps a stable cache key."""
+    return int(datetime.combine(today - timedelta(days=1), time(12)).timestamp())
 
 
 @dataclass(slots=True)
@@ -15,15 +33,18 @@ class WeatherClient:
     """Thin wrapper around the weather API that hides caching and error handling."""
 
     settings: AppSettings
-    cache: Optional[Any] = None  # diskcache.Cache, but kept loose for easier testing
+    # diskcache.Cache, but kept loose for easier testing. Keys are plain strings with
+    # coordinates fixed to 4 decimals, the precision the API echoes back, plus units.
+    cache: Optional[Any] = None
+    session: requests.Session = field(default_factory=get_session)
 
     def fetch_current(self, lat: float, lon: float) -> Dict[str, Any]:
         """Fetch current weather plus hourly/daily forecasts."""
 
         self.settings.require_weather_api_key()
         cache_key = None
-        if self.cache:
-            cache_key = f"weather_{lat}_{lon}"
+        if self.cache is not None:
+            cache_key = f"weather_{lat:.4f}_{lon:.4f}_{self.settings.weather_units}"
             cached = self.cache.get(cache_key)
             if cached is not None:
                 return cached
@@ -35,10 +56,10 @@ class WeatherClient:
             "exclude": "minutely",
             "appid": self.settings.weather_api_key,
         }
-        response = requests.get(self.settings.weather_api_url, params=params, timeout=10)
+        response = self.session.get(self.settings.weather_api_url, params=params, timeout=10)
         response.raise_for_status()
-        data = response.json()
-        if self.cache and cache_key:
+        data = orjson.loads(response.content)
+        if cache_key is not None:
             self.cache.set(cache_key, data, expire=self.settings.weather_cache_ttl_seconds)
         return data
 
@@ -46,13 +67,11 @@ class WeatherClient:
         """Fetch a coarse summary for yesterday using the time-machine API."""
 
         self.settings.require_weather_api_key()
-        now = datetime.utcnow()
-        yesterday_noon = now.replace(hour=12, minute=0, second=0, microsecond=0) - timedelta(days=1)
-        timestamp = int(yesterday_noon.timestamp())
+        timestamp = _yesterday_noon_timestamp(date.today())
 
         cache_key = None
-        if self.cache:
-            cache_key = f"weather_yesterday_{lat}_{lon}_{timestamp}"
+        if self.cache is not None:
+            cache_key = f"weather_yesterday_{lat:.4f}_{lon:.4f}_{self.settings.weather_units}_{timestamp}"
             cached = self.cache.get(cache_key)
             if cached is not None:
                 return cached
@@ -64,25 +83,27 @@ class WeatherClient:
             "units": self.settings.weather_units,
             "appid": self.settings.weather_api_key,
         }
-        response = requests.get(self.settings.weather_timemachine_url, params=params, timeout=10)
+        response = self.session.get(self.settings.weather_timemachine_url, params=params, timeout=10)
         response.raise_for_status()
-        payload = response.json()
+        payload = orjson.loads(response.content)
         data = payload.get("data") or []
         if not data:
             return None
 
         entry = data[0]
+        # The timemachine API returns a single observation, so avg/high/low are the same reading.
+        temp = entry.get("temp")
+        temp = round(temp, 1) if temp is not None else None
+        feels_like = entry.get("feels_like")
         summary = {
-            "date": datetime.fromtimestamp(entry["dt"]).strftime("%A, %B %d"),
-            "avg_temp": round(entry.get("temp"), 1) if entry.get("temp") is not None else None,
-            "high_temp": round(entry.get("temp"), 1) if entry.get("temp") is not None else None,
-            "low_temp": round(entry.get("temp"), 1) if entry.get("temp") is not None else None,
-            "avg_feels_like": round(entry.get("feels_like"), 1)
-            if entry.get("feels_like") is not None
-            else None,
+            "date": _format_day(entry["dt"]),
+            "avg_temp": temp,
+            "high_temp": temp,
+            "low_temp": temp,
+            "avg_feels_like": round(feels_like, 1) if feels_like is not None else None,
             "main_condition": (entry.get("weather") or [{}])[0].get("main", "Unknown"),
         }
 
-        if self.cache and cache_key:
-            self.cache.set(cache_key, summary, expire=self.settings.weather_cache_ttl_seconds * 6)
+        if cache_key is not None:
+            self.cache.set(cache_key, summary, expire=_YESTERDAY_TTL_SECONDS)
         return summary
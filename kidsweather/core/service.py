@@ -1,20 +1,38 @@
 """High level orchestration for building kid-friendly weather reports."""
 from __future__ import annotations
 
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional
-
-import diskcache
+from typing import Any, Dict, Optional, Tuple
 
+from ..clients.http import get_session
 from ..clients.llm import LLMClient
+from ..infrastructure.cache_provider import create_cache
 from ..infrastructure.logging import LLMInteractionLogger
 from .settings import AppSettings, load_settings
 from ..clients.weather import WeatherClient
 from ..formatting.weather import extract_display_data, format_for_llm
 
 
+# Most reports have no alerts; share one immutable empty sequence for them.
+_EMPTY_ALERTS: Tuple[str, ...] = ()
+
+
+@lru_cache(maxsize=64)
+def _format_last_updated(minute: int) -> str:
+    """Format an epoch minute; reports built from the same cached payload share it."""
+    return datetime.fromtimestamp(minute * 60).strftime("%A, %B %-d at %-I:%M %p")
+
+
+@lru_cache(maxsize=32)
+def _read_prompt_file(path: Path, mtime_ns: int) -> str:
+    """Read a prompt file; keyed on mtime so edits are picked up without a restart."""
+    return path.read_text()
+
+
 @dataclass(slots=True)
 class WeatherReportService:
     """Coordinates weather retrieval, formatting, LLM generation, and logging."""
@@ -25,6 +43,8 @@ class WeatherReportService:
     logger: Optional[LLMInteractionLogger] = None
     last_llm_context: Optional[str] = None
     last_system_prompt: Optional[str] = None
+    # Reused across reports so the weather fetches don't spin up threads each time.
+    executor: ThreadPoolExecutor = field(default_factory=lambda: ThreadPoolExecutor(max_workers=2))
 
     def build_report(
         self,
@@ -40,18 +60,23 @@ class WeatherReportService:
     ) -> Dict[str, Any]:
         """Return a fully populated report ready for display layers."""
 
-        weather_data = weather_data_override or self._fetch_weather_data(latitude, longitude)
+        want_yesterday = include_yesterday and bool(self.settings.weather_api_key)
         yesterday = None
-        if (
-            include_yesterday
-            and weather_data
-            and weather_data.get("lat")
-            and weather_data.get("lon")
-            and self.settings.weather_api_key
-        ):
-            yesterday = self.weather_client.fetch_yesterday_summary(
-                weather_data["lat"], weather_data["lon"]
+        if weather_data_override is None and want_yesterday:
+            # Both lookups only need coordinates, so overlap the two round-trips.
+            lat_value, lon_value = self._resolve_coordinates(latitude, longitude)
+            weather_future = self.executor.submit(self.weather_client.fetch_current, lat_value, lon_value)
+            yesterday_future = self.executor.submit(
+                self.weather_client.fetch_yesterday_summary, lat_value, lon_value
             )
+            weather_data = weather_future.result()
+            yesterday = yesterday_future.result()
+        else:
+            weather_data = weather_data_override or self._fetch_weather_data(latitude, longitude)
+            if want_yesterday and weather_data and weather_data.get("lat") and weather_data.get("lon"):
+                yesterday = self.weather_client.fetch_yesterday_summary(
+                    weather_data["lat"], weather_data["lon"]
+                )
 
         prompt = self._resolve_prompt(prompt_override)
         llm_context = format_for_llm(weather_data, yesterday)
@@ -87,19 +112,24 @@ class WeatherReportService:
         self.last_system_prompt = prompt
         return self._assemble_report(weather_data, llm_response, display_data)
 
-    def _fetch_weather_data(self, latitude: Optional[float], longitude: Optional[float]) -> Dict[str, Any]:
+    def _resolve_coordinates(
+        self, latitude: Optional[float], longitude: Optional[float]
+    ) -> Tuple[float, float]:
         lat_value = latitude if latitude is not None else self.settings.default_lat
         lon_value = longitude if longitude is not None else self.settings.default_lon
-        return self.weather_client.fetch_current(lat_value, lon_value)
+        return lat_value, lon_value
+
+    def _fetch_weather_data(self, latitude: Optional[float], longitude: Optional[float]) -> Dict[str, Any]:
+        return self.weather_client.fetch_current(*self._resolve_coordinates(latitude, longitude))
 
     def _resolve_prompt(self, prompt_override: Optional[str]) -> str:
         if not prompt_override:
             default_file = self.settings.prompt_dir / "default.txt"
-            return default_file.read_text()
+            return _read_prompt_file(default_file, default_file.stat().st_mtime_ns)
 
         path = Path(prompt_override)
-        if path.exists() and path.is_file():
-            return path.read_text()
+        if path.is_file():
+            return _read_prompt_file(path, path.stat().st_mtime_ns)
         return prompt_override
 
     @staticmethod
@@ -108,26 +138,28 @@ class WeatherReportService:
         llm_response: Dict[str, Any],
         display_data: Dict[str, Any],
     ) -> Dict[str, Any]:
-        icon = display_data["current"].get("icon")
+        current = display_data["current"]
+        forecast = display_data["forecast"]
+        icon = current.get("icon")
+        raw_alerts = display_data.get("alerts")
+        alerts = (
+            [f"{alert['event']} ({alert['start']} to {alert['end']})" for alert in raw_alerts]
+            if raw_alerts
+            else _EMPTY_ALERTS
+        )
         timestamp = weather_data.get("current", {}).get("dt")
-        last_updated = "Unknown"
-        if timestamp:
-            dt = datetime.fromtimestamp(timestamp)
-            last_updated = dt.strftime("%A, %B %d at %I:%M %p").lstrip("0").replace(" 0", " ")
+        last_updated = _format_last_updated(timestamp // 60) if timestamp else "Unknown"
 
         return {
             "description": llm_response.get("description", ""),
             "daily_forecasts_llm": llm_response.get("daily_forecasts", {}),
-            "temperature": display_data["current"].get("temp"),
-            "feels_like": display_data["current"].get("feels_like"),
-            "conditions": display_data["current"].get("conditions"),
-            "high_temp": display_data["forecast"].get("high_temp"),
-            "low_temp": display_data["forecast"].get("low_temp"),
+            "temperature": current.get("temp"),
+            "feels_like": current.get("feels_like"),
+            "conditions": current.get("conditions"),
+            "high_temp": forecast.get("high_temp"),
+            "low_temp": forecast.get("low_temp"),
             "icon_url": f"http://openweathermap.org/img/wn/{icon}@4x.png" if icon else None,
-            "alerts": [
-                f"{alert['event']} ({alert['start']} to {alert['end']})"
-                for alert in display_data.get("alerts", [])
-            ],
+            "alerts": alerts,
             "last_updated": last_updated,
             "daily_forecast_raw": display_data.get("daily_forecast_raw", []),
             "_raw_llm_response": llm_response.get("_raw_llm_response"),
@@ -139,13 +171,14 @@ def build_default_service() -> WeatherReportService:
     """Convenience constructor used by CLI and web app entrypoints."""
 
     settings = load_settings()
-    settings.cache_dir.mkdir(parents=True, exist_ok=True)
-    shared_cache = diskcache.Cache(settings.cache_dir)
-    weather_client = WeatherClient(settings, cache=shared_cache)
+    shared_cache = create_cache(settings.cache_dir)
+    session = get_session()
+    weather_client = WeatherClient(settings, cache=shared_cache, session=session)
     llm_client = LLMClient(
         settings,
         cache=shared_cache,
         cache_ttl_seconds=settings.weather_cache_ttl_seconds,
+        session=session,
     )
     logger = LLMInteractionLogger(settings.llm_log_db)
     return WeatherReportService(settings, weather_client, llm_client, logger=logger)
@@ -12,10 +12,16 @@ from pathlib import Path
 from typing import Optional
 import os
 
-from dotenv import load_dotenv
 
+# Filesystem layout is fixed relative to the package, so resolve it once at import.
+_ROOT_DIR = Path(__file__).parent.parent.parent
+_CACHE_DIR = _ROOT_DIR / "api_cache"
+_PROMPT_DIR = _ROOT_DIR / "prompts"
+_TEST_DATA_DIR = _ROOT_DIR / "test_data"
+_LLM_LOG_DB = _ROOT_DIR / "llm_log.sqlite3"
 
-@dataclass(slots=True)
+
+@dataclass(slots=True, frozen=True)
 class AppSettings:
     """Application configuration with all settings in a single flat structure."""
 
@@ -82,11 +88,7 @@ class AppSettings:
 
     def has_fallback_llm(self) -> bool:
         """Return True if fallback LLM is configured."""
-        return all([
-            self.fallback_llm_api_url,
-            self.fallback_llm_api_key,
-            self.fallback_llm_model
-        ])
+        return bool(self.fallback_llm_api_url and self.fallback_llm_api_key and self.fallback_llm_model)
 
 
 @lru_cache(maxsize=1)
@@ -105,44 +107,42 @@ def load_settings(env_file: Optional[str] = None) -> AppSettings:
         Fully populated settings dataclass with lazily-created directories.
     """
 
-    load_dotenv(env_file)  # Idempotent; safe to call repeatedly.
+    from dotenv import load_dotenv  # Deferred so importing settings stays cheap.
+
+    load_dotenv(env_file)  # The only .env load; entrypoints do not call load_dotenv themselves.
 
-    root_dir = Path(__file__).parent.parent.parent
-    cache_dir = root_dir / "api_cache"
-    prompt_dir = root_dir / "prompts"
-    test_data_dir = root_dir / "test_data"
-    llm_log_db = root_dir / "llm_log.sqlite3"
+    env = os.environ.get
 
     settings = AppSettings(
         # Paths
-        root_dir=root_dir,
-        cache_dir=cache_dir,
-        prompt_dir=prompt_dir,
-        test_data_dir=test_data_dir,
-        llm_log_db=llm_log_db,
+        root_dir=_ROOT_DIR,
+        cache_dir=_CACHE_DIR,
+        prompt_dir=_PROMPT_DIR,
+        test_data_dir=_TEST_DATA_DIR,
+        llm_log_db=_LLM_LOG_DB,
         # Weather API
-        weather_api_url=os.getenv("WEATHER_API_URL", "https://api.openweathermap.org/data/3.0/onecall"),
-        weather_timemachine_url=os.getenv(
+        weather_api_url=env("WEATHER_API_URL", "https://api.openweathermap.org/data/3.0/onecall"),
+        weather_timemachine_url=env(
             "WEATHER_TIMEMACHINE_API_URL",
             "https://api.openweathermap.org/data/3.0/onecall/timemachine",
         ),
-        weather_units=os.getenv("WEATHER_UNITS", "imperial"),
-        weather_cache_ttl_seconds=int(os.getenv("API_CACHE_TIME", "600")),
-        weather_api_key=os.getenv("WEATHER_API_KEY"),
+        weather_units=env("WEATHER_UNITS", "imperial"),
+        weather_cache_ttl_seconds=int(env("API_CACHE_TIME", "600")),
+        weather_api_key=env("WEATHER_API_KEY"),
         # Primary LLM
-        llm_api_url=os.getenv("LLM_API_URL"),
-        llm_api_key=os.getenv("LLM_API_KEY"),
-        llm_model=os.getenv("LLM_MODEL"),
-        llm_supports_json_mode=os.getenv("LLM_SUPPORTS_JSON_MODE", "true").lower() == "true",
+        llm_api_url=env("LLM_API_URL"),
+        llm_api_key=env("LLM_API_KEY"),
+        llm_model=env("LLM_MODEL"),
+        llm_supports_json_mode=env("LLM_SUPPORTS_JSON_MODE", "true").lower() == "true",
         # Fallback LLM
-        fallback_llm_api_url=os.getenv("FALLBACK_LLM_API_URL"),
-        fallback_llm_api_key=os.getenv("FALLBACK_LLM_API_KEY"),
-        fallback_llm_model=os.getenv("FALLBACK_LLM_MODEL"),
-        fallback_llm_supports_json_mode=os.getenv("FALLBACK_LLM_SUPPORTS_JSON_MODE", "true").lower() == "true",
+        fallback_llm_api_url=env("FALLBACK_LLM_API_URL"),
+        fallback_llm_api_key=env("FALLBACK_LLM_API_KEY"),
+        fallback_llm_model=env("FALLBACK_LLM_MODEL"),
+        fallback_llm_supports_json_mode=env("FALLBACK_LLM_SUPPORTS_JSON_MODE", "true").lower() == "true",
         # Default location
-        default_lat=float(os.getenv("DEFAULT_LAT", "38.9541848")),
-        default_lon=float(os.getenv("DEFAULT_LON", "-77.0832061")),
-        default_location=os.getenv("DEFAULT_LOCATION", "Washington, DC"),
+        default_lat=float(env("DEFAULT_LAT", "38.9541848")),
+        default_lon=float(env("DEFAULT_LON", "-77.0832061")),
+        default_location=env("DEFAULT_LOCATION", "Washington, DC"),
     )
 
     settings.ensure_directories()
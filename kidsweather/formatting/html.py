@@ -1,8 +1,27 @@
 """HTML rendering for weather reports using Jinja2."""
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict
 
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, select_autoescape
+
+from ..core.settings import load_settings
+
+
+_TEMPLATE_DIR = Path(__file__).parent.parent / "templates"
+
+
+@lru_cache(maxsize=1)
+def _get_env() -> Environment:
+    """Build the Jinja2 environment once; compiled templates persist in the API cache dir."""
+    bytecode_dir = load_settings().cache_dir / "jinja"
+    bytecode_dir.mkdir(parents=True, exist_ok=True)
+    return Environment(
+        loader=FileSystemLoader(_TEMPLATE_DIR),
+        autoescape=select_autoescape(['html', 'xml']),
+        bytecode_cache=FileSystemBytecodeCache(str(bytecode_dir)),
+        auto_reload=False,
+    )
 
 
 def render_weather_html(weather_data: Dict[str, Any], template_name: str = "weather.html") -> str:
@@ -15,17 +34,7 @@ def render_weather_html(weather_data: Dict[str, Any], template_name: str = "weat
     Returns:
         Rendered HTML string
     """
-    # Determine template directory - it's in kidsweather/templates/
-    template_dir = Path(__file__).parent.parent / "templates"
-
-    # Create Jinja2 environment
-    env = Environment(
-        loader=FileSystemLoader(template_dir),
-        autoescape=select_autoescape(['html', 'xml'])
-    )
-
-    # Load and render template
-    template = env.get_template(template_name)
+    template = _get_env().get_template(template_name)
     return template.render(weather=weather_data)
 
 
@@ -37,6 +46,6 @@ def render_to_file(weather_data: Dict[str, Any], output_file: str, template_name
         output_file: Path to output HTML file
         template_name: Name of the template file to use
     """
-    html_content = render_weather_html(weather_data, template_name)
-    with open(output_file, 'w') as fh:
-        fh.write(html_content)
+    template = _get_env().get_template(template_name)
+    with open(output_file, 'w', buffering=64 * 1024) as fh:
+        template.stream(weather=weather_data).dump(fh)
@@ -1,45 +1,78 @@
 """Helpers for shaping weather data for display and LLM consumption."""
 from __future__ import annotations
 
+import time
+from bisect import bisect_right
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+# Stand-in for a missing "weather" array; shared and read-only, so no per-call list is built.
+_NO_WEATHER: Tuple[Dict[str, Any], ...] = ({},)
+
+# UV index bands: values below each threshold use the label at the same position.
+_UVI_THRESHOLDS = (4, 6, 8)
+_UVI_LABELS = ("(low)", "(mild)", "- Mention sunscreen", "- Sunscreen is a must!")
+
+# Wind bands above calm (> 1 mph); speeds at or above each threshold move up one template.
+_WIND_THRESHOLDS = (5, 15, 25)
+_WIND_TEMPLATES = (
+    "Mostly calm.",
+    "Light winds around {:.0f} mph.",
+    "Windy, around {:.0f} mph.",
+    "Very windy, around {:.0f} mph.",
+)
+
+# Indexed by date.weekday(); avoids locale-aware strftime("%A") for English day names.
+_DAY_NAMES = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+
+
+@lru_cache(maxsize=8)
+def _tz_for_offset(tz_offset: int) -> timezone:
+    return timezone(timedelta(seconds=tz_offset))
+
+
+def _local_datetime(timestamp_utc: int, tz_offset: int) -> datetime:
+    # Shift the epoch before converting; the result matches utc + timedelta(offset) without the extra add.
+    return datetime.fromtimestamp(timestamp_utc + tz_offset, tz=timezone.utc)
 
 
 def format_alert_time(timestamp: int, timezone_offset: int) -> str:
     """Return human friendly alert timing, including day if needed."""
 
-    dt = datetime.fromtimestamp(timestamp, tz=timezone.utc) + timedelta(seconds=timezone_offset)
-    today = datetime.now(timezone(timedelta(seconds=timezone_offset))).date()
+    dt = _local_datetime(timestamp, timezone_offset)
+    today = datetime.now(_tz_for_offset(timezone_offset)).date()
     if dt.date() == today:
         return dt.strftime("%-I%p")
     return dt.strftime("%-I%p %a")
 
 
+def _format_alert_bound(timestamp: Optional[int], tz_offset: int) -> str:
+    return format_alert_time(timestamp, tz_offset) if timestamp else "N/A"
+
+
+@lru_cache(maxsize=64)
 def _format_clock(timestamp_utc: Optional[int], tz_offset: int) -> str:
     if timestamp_utc is None:
         return "N/A"
-    dt = datetime.fromtimestamp(timestamp_utc, tz=timezone.utc) + timedelta(seconds=tz_offset)
-    return dt.strftime("%I:%M %p")
+    # Plain integer maths gives the same "%I:%M %p" text without building a datetime.
+    hour, minute = divmod((int(timestamp_utc) + tz_offset) // 60 % 1440, 60)
+    return f"{hour % 12 or 12:02d}:{minute:02d} {'AM' if hour < 12 else 'PM'}"
 
 
+@lru_cache(maxsize=32)
 def _day_name(timestamp_utc: Optional[int], tz_offset: int) -> str:
     if timestamp_utc is None:
         return "N/A"
-    dt = datetime.fromtimestamp(timestamp_utc, tz=timezone.utc) + timedelta(seconds=tz_offset)
-    return dt.strftime("%A")
+    # The Unix epoch fell on a Thursday (weekday 3).
+    return _DAY_NAMES[((int(timestamp_utc) + tz_offset) // 86400 + 3) % 7]
 
 
 def _describe_wind(speed: Optional[float], gust: Optional[float] = None) -> str:
     if speed is None:
         return "Wind data not available."
-    if speed >= 25:
-        description = f"Very windy, around {speed:.0f} mph."
-    elif speed >= 15:
-        description = f"Windy, around {speed:.0f} mph."
-    elif speed >= 5:
-        description = f"Light winds around {speed:.0f} mph."
-    elif speed > 1:
-        description = "Mostly calm."
+    if speed > 1:
+        description = _WIND_TEMPLATES[bisect_right(_WIND_THRESHOLDS, speed)].format(speed)
     else:
         description = "No wind."
     if gust and gust > speed * 1.5 and gust > 5:
@@ -51,14 +84,7 @@ def _describe_uvi(uvi: Optional[float]) -> str:
     if uvi is None:
         return "N/A"
     value = float(uvi)
-    if value < 4:
-        return f"{value:.1f} (low)"
-    elif value < 6:
-        return f"{value:.1f} (mild)"
-    elif value < 8:
-        return f"{value:.1f} - Mention sunscreen"
-    else:
-        return f"{value:.1f} - Sunscreen is a must!"
+    return f"{value:.1f} {_UVI_LABELS[bisect_right(_UVI_THRESHOLDS, value)]}"
 
 
 def _safe_round(value: Optional[float]) -> Optional[int]:
@@ -68,8 +94,15 @@ def _safe_round(value: Optional[float]) -> Optional[int]:
 
 
 def _format_metric(value: Optional[float]) -> str:
-    rounded = _safe_round(value)
-    return f"{rounded}°F" if rounded is not None else "N/A"
+    # round() already returns an int, so one None check covers both helpers' work.
+    return f"{round(value)}°F" if value is not None else "N/A"
+
+
+@lru_cache(maxsize=4)
+def _current_time_header(local_quarter_hour: int) -> str:
+    # Rounded to the quarter hour so the LLM context (and its cache key) is stable within that window.
+    rounded_time = datetime.fromtimestamp(local_quarter_hour * 900, tz=timezone.utc)
+    return f"Current Date and Time: {rounded_time.strftime('%A, %B %d, %Y at %I:%M %p')}"
 
 
 def format_for_llm(weather_data: Dict[str, Any], yesterday_data: Optional[Dict[str, Any]] = None) -> str:
@@ -78,10 +111,7 @@ def format_for_llm(weather_data: Dict[str, Any], yesterday_data: Optional[Dict[s
     tz_offset = weather_data.get("timezone_offset", 0)
     lines: List[str] = []
 
-    current_time = datetime.now(timezone.utc) + timedelta(seconds=tz_offset)
-    rounded_minute = (current_time.minute // 15) * 15
-    rounded_time = current_time.replace(minute=rounded_minute, second=0, microsecond=0)
-    lines.append(f"Current Date and Time: {rounded_time.strftime('%A, %B %d, %Y at %I:%M %p')}")
+    lines.append(_current_time_header((int(time.time()) + tz_offset) // 900))
 
     if yesterday_data:
         lines.append(f"\nYESTERDAY'S WEATHER ({yesterday_data['date']}):")
@@ -95,12 +125,12 @@ def format_for_llm(weather_data: Dict[str, Any], yesterday_data: Optional[Dict[s
 
     current = weather_data.get("current", {})
     lines.append("\nTODAY'S FORECAST:")
-    desc = (current.get("weather") or [{}])[0].get("description", "Not available")
-    temperature = _format_metric(current.get("temp"))
-    line = f"  Right Now: {desc} at {temperature}"
+    desc = (current.get("weather") or _NO_WEATHER)[0].get("description", "Not available")
+    temp = current.get("temp")
+    line = f"  Right Now: {desc} at {_format_metric(temp)}"
     feels_like = current.get("feels_like")
-    if feels_like is not None and current.get("temp") is not None:
-        if abs(round(current["temp"]) - round(feels_like)) > 5:
+    if feels_like is not None and temp is not None:
+        if abs(round(temp) - round(feels_like)) > 5:
             line += f" (feels like {round(feels_like)}°F)"
     lines.append(line)
 
@@ -130,8 +160,9 @@ def format_for_llm(weather_data: Dict[str, Any], yesterday_data: Optional[Dict[s
         lines.append(
             f"\n  Overall for Today ({_day_name(today.get('dt'), tz_offset)}): {summary}"
         )
-        high = _format_metric(today.get("temp", {}).get("max"))
-        low = _format_metric(today.get("temp", {}).get("min"))
+        today_temp = today.get("temp", {})
+        high = _format_metric(today_temp.get("max"))
+        low = _format_metric(today_temp.get("min"))
         lines.append(f"  High: {high}, Low for tonight: {low}.")
         lines.append(f"  Precipitation: {describe_precipitation(today)}")
         lines.append(f"  Day Wind: {_describe_wind(today.get('wind_speed'), today.get('wind_gust'))}")
@@ -139,42 +170,51 @@ def format_for_llm(weather_data: Dict[str, Any], yesterday_data: Optional[Dict[s
     hourly = weather_data.get("hourly", [])
     if hourly:
         lines.append("\nNEXT 8 HOURS:")
-        for hour in hourly[:8]:
-            hour_line = f"  {_format_clock(hour.get('dt'), tz_offset)}: "
-            hour_line += f"{(hour.get('weather') or [{}])[0].get('description', 'N/A')}"
-            hour_line += f" at {_format_metric(hour.get('temp'))}"
-            uvi = hour.get("uvi")
-            if uvi and float(uvi) >= 6:
-                hour_line += f" (UV {_describe_uvi(uvi)})"
-            pop = hour.get("pop", 0)
-            if pop:
-                details: List[str] = [f"{int(pop * 100)}% chance precip"]
-                rain_amt = hour.get("rain", {}).get("1h", 0)
-                snow_amt = hour.get("snow", {}).get("1h", 0)
-                if rain_amt:
-                    details.append(f"{rain_amt}mm rain")
-                if snow_amt:
-                    details.append(f"{snow_amt}mm snow")
-                hour_line += f" ({', '.join(details)})"
-            lines.append(hour_line)
+        lines.extend(_format_hour(hour, tz_offset) for hour in hourly[:8])
 
     lines.append("\nNEXT FEW DAYS (for daily_forecasts - use these exact day names):")
     if len(daily) > 1:
-        for day in daily[1:5]:
-            lines.append(f"\n  {_day_name(day.get('dt'), tz_offset)}:")
-            lines.append(f"    Summary: {day.get('summary', 'No summary available.')}")
-            lines.append(
-                f"    High: {_format_metric(day.get('temp', {}).get('max'))}, "
-                f"Low: {_format_metric(day.get('temp', {}).get('min'))}."
-            )
-            lines.append(f"    Precipitation: {describe_precipitation(day)}")
-            lines.append(f"    Wind: {_describe_wind(day.get('wind_speed'), day.get('wind_gust'))}")
+        lines.extend(_format_forecast_day(day, tz_offset) for day in daily[1:5])
     else:
         lines.append("  No extended forecast available.")
 
     return "\n".join(lines)
 
 
+def _format_hour(hour: Dict[str, Any], tz_offset: int) -> str:
+    hour_line = (
+        f"  {_format_clock(hour.get('dt'), tz_offset)}: "
+        f"{(hour.get('weather') or _NO_WEATHER)[0].get('description', 'N/A')}"
+        f" at {_format_metric(hour.get('temp'))}"
+    )
+    uvi = hour.get("uvi")
+    if uvi and float(uvi) >= 6:
+        hour_line += f" (UV {_describe_uvi(uvi)})"
+    pop = hour.get("pop", 0)
+    if pop:
+        details: List[str] = [f"{int(pop * 100)}% chance precip"]
+        rain_amt = hour.get("rain", {}).get("1h", 0)
+        snow_amt = hour.get("snow", {}).get("1h", 0)
+        if rain_amt:
+            details.append(f"{rain_amt}mm rain")
+        if snow_amt:
+            details.append(f"{snow_amt}mm snow")
+        hour_line += f" ({', '.join(details)})"
+    return hour_line
+
+
+def _format_forecast_day(day: Dict[str, Any], tz_offset: int) -> str:
+    temp = day.get("temp", {})
+    return (
+        f"\n  {_day_name(day.get('dt'), tz_offset)}:\n"
+        f"    Summary: {day.get('summary', 'No summary available.')}\n"
+        f"    High: {_format_metric(temp.get('max'))}, "
+        f"Low: {_format_metric(temp.get('min'))}.\n"
+        f"    Precipitation: {describe_precipitation(day)}\n"
+        f"    Wind: {_describe_wind(day.get('wind_speed'), day.get('wind_gust'))}"
+    )
+
+
 def describe_precipitation(day: Dict[str, Any]) -> str:
     """Return a short precipitation summary for a daily forecast entry."""
 
@@ -200,44 +240,47 @@ def extract_display_data(weather_data: Dict[str, Any]) -> Dict[str, Any]:
     current = weather_data.get("current", {})
     daily = weather_data.get("daily", [])
 
-    alerts_payload = []
     tz_offset = weather_data.get("timezone_offset", 0)
-    for alert in (weather_data.get("alerts") or []):
-        start = alert.get("start")
-        end = alert.get("end")
-        alerts_payload.append(
-            {
-                "event": alert.get("event", "Weather Alert"),
-                "start": format_alert_time(start, tz_offset) if start else "N/A",
-                "end": format_alert_time(end, tz_offset) if end else "N/A",
-            }
-        )
+    alerts_payload = [
+        {
+            "event": alert.get("event", "Weather Alert"),
+            "start": _format_alert_bound(alert.get("start"), tz_offset),
+            "end": _format_alert_bound(alert.get("end"), tz_offset),
+        }
+        for alert in (weather_data.get("alerts") or ())
+    ]
 
     forecast_days = []
     for day in daily[:5]:
         timestamp = day.get("dt")
-        day_name = datetime.fromtimestamp(timestamp).strftime("%A") if timestamp else "Unknown"
+        day_name = _day_name(timestamp, tz_offset) if timestamp else "Unknown"
+        weather = (day.get("weather") or _NO_WEATHER)[0]
+        temp = day.get("temp", {})
         forecast_days.append(
             {
                 "day": day_name,
-                "high": _safe_round(day.get("temp", {}).get("max")),
-                "low": _safe_round(day.get("temp", {}).get("min")),
-                "conditions": (day.get("weather") or [{}])[0].get("description"),
+                "high": _safe_round(temp.get("max")),
+                "low": _safe_round(temp.get("min")),
+                "conditions": weather.get("description"),
                 "precip_prob": float(day.get("pop", 0) or 0) * 100,
-                "icon": (day.get("weather") or [{}])[0].get("icon"),
+                "icon": weather.get("icon"),
             }
         )
 
     today = daily[0] if daily else None
-    high = today.get("temp", {}).get("max") if today else current.get("temp")
-    low = today.get("temp", {}).get("min") if today else current.get("temp")
+    if today:
+        today_temp = today.get("temp", {})
+        high, low = today_temp.get("max"), today_temp.get("min")
+    else:
+        high = low = current.get("temp")
+    current_weather = (current.get("weather") or _NO_WEATHER)[0]
 
     return {
         "current": {
             "temp": _safe_round(current.get("temp")),
             "feels_like": _safe_round(current.get("feels_like")),
-            "conditions": (current.get("weather") or [{}])[0].get("description", "") if current else "",
-            "icon": (current.get("weather") or [{}])[0].get("icon", "") if current else "",
+            "conditions": current_weather.get("description", ""),
+            "icon": current_weather.get("icon", ""),
         },
         "forecast": {
             "high_temp": _safe_round(high),
@@ -0,0 +1,35 @@
+"""Cache construction and management utilities."""
+from __future__ import annotations
+
+from pathlib import Path
+
+import diskcache
+import orjson
+from diskcache.core import UNKNOWN
+
+
+class OrjsonDisk(diskcache.Disk):
+    """Serialize cached values with orjson instead of pickle.
+
+    Everything we cache (weather payloads, yesterday summaries, parsed LLM
+    output) is JSON-shaped. Keys keep diskcache's default handling, and
+    entries pickled by older versions still load because only values that
+    come back as bytes are decoded here.
+    """
+
+    def store(self, value, read, key=UNKNOWN):
+        if not read:
+            value = orjson.dumps(value)
+        return super().store(value, read, key=key)
+
+    def fetch(self, mode, filename, value, read):
+        data = super().fetch(mode, filename, value, read)
+        if not read and isinstance(data, bytes):
+            data = orjson.loads(data)
+        return data
+
+
+def create_cache(cache_dir: Path) -> diskcache.Cache:
+    """Open the shared on-disk cache used by the weather and LLM clients."""
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return diskcache.Cache(cache_dir, disk=OrjsonDisk)
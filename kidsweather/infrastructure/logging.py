@@ -1,11 +1,12 @@
 """SQLite-based persistence for LLM interactions."""
 from __future__ import annotations
 
-import json
 import sqlite3
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, ClassVar, Dict, Optional, Set
+
+import orjson
 
 
 SCHEMA = """
@@ -23,23 +24,53 @@ CREATE TABLE IF NOT EXISTS llm_interactions (
 )
 """
 
+# Bumped whenever ensure_schema gains a migration; stored in PRAGMA user_version.
+SCHEMA_VERSION = 1
+
+INSERT_SQL = """
+INSERT INTO llm_interactions (
+    location_name, weather_input, llm_context,
+    system_prompt, model_used, llm_output,
+    description, source
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
 
 @dataclass(slots=True)
 class LLMInteractionLogger:
     """Utility for writing structured interaction logs."""
 
     database_path: Path
+    # Shared across instances so every logger for the same file skips re-checking the schema.
+    _verified_paths: ClassVar[Set[Path]] = set()
+    _conn: Optional[sqlite3.Connection] = field(default=None, init=False, repr=False)
+
+    def _connection(self) -> sqlite3.Connection:
+        """Open one autocommit connection per logger, using WAL so inserts skip the fsync."""
+
+        if self._conn is None:
+            conn = sqlite3.connect(self.database_path, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn = conn
+        return self._conn
 
     def ensure_schema(self) -> None:
         """Create the backing table if it does not already exist."""
 
-        with sqlite3.connect(self.database_path) as conn:
+        if self.database_path in self._verified_paths:
+            return
+        conn = self._connection()
+        (version,) = conn.execute("PRAGMA user_version").fetchone()
+        if version < SCHEMA_VERSION:
             conn.execute(SCHEMA)
             # Legacy databases might be missing llm_context; add it idempotently.
             cursor = conn.execute("PRAGMA table_info(llm_interactions)")
             columns = {row[1] for row in cursor.fetchall()}
             if "llm_context" not in columns:
                 conn.execute("ALTER TABLE llm_interactions ADD COLUMN llm_context TEXT")
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        self._verified_paths.add(self.database_path)
 
     def log(
         self,
@@ -57,22 +88,12 @@ class LLMInteractionLogger:
 
         payload = (
             location_name or "N/A",
-            json.dumps(weather_input),
+            orjson.dumps(weather_input).decode(),
             llm_context,
             system_prompt,
             model_used,
-            json.dumps(llm_output),
+            orjson.dumps(llm_output).decode(),
             description,
             source,
         )
-        with sqlite3.connect(self.database_path) as conn:
-            conn.execute(
-                """
-                INSERT INTO llm_interactions (
-                    location_name, weather_input, llm_context,
-                    system_prompt, model_used, llm_output,
-                    description, source
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                payload,
-            )
+        self._connection().execute(INSERT_SQL, payload)
@@ -10,40 +10,11 @@
 # ]
 # ///
 
-import json
-from datetime import datetime
-from pathlib import Path
-from typing import Optional
-
 import click
-from dotenv import load_dotenv
 
 from .core.settings import load_settings
 from .core.service import build_default_service
-from .formatting.html import render_to_file
-
-
-def save_weather_data(data: dict, filename: Optional[str] = None, *, directory: Optional[Path] = None) -> Path:
-    """Persist raw weather data to disk for later replay or testing."""
-    settings = load_settings()
-    target_dir = directory or settings.test_data_dir
-    target_dir.mkdir(parents=True, exist_ok=True)
-
-    if not filename:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"weather_{timestamp}.json"
-
-    path = target_dir / filename
-    path.write_text(json.dumps(data, indent=2))
-    return path
-
-
-def load_weather_data(filename: str, *, directory: Optional[Path] = None) -> dict:
-    """Load weather data previously saved for deterministic runs."""
-    settings = load_settings()
-    target_dir = directory or settings.test_data_dir
-    path = target_dir / filename
-    return json.loads(path.read_text())
+from .utils.file_utils import load_weather_data, save_weather_data
 
 
 @click.command()
@@ -133,10 +104,12 @@ def main(lat, lon, save, load, render, log_interactions, prompt, model, verbose)
         click.echo(f"\nAlerts: {', '.join(report['alerts'])}")
 
     if render:
+        # Imported lazily: Jinja2 is only needed when rendering HTML.
+        from .formatting.html import render_to_file
+
         render_to_file(report, render)
         click.echo(f"\nRendered HTML to: {render}")
 
 
 if __name__ == '__main__':
-    load_dotenv()
     main()
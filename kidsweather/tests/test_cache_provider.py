@@ -0,0 +1,30 @@
+"""Tests for the orjson-backed diskcache used by the API clients."""
+import diskcache
+import pytest
+
+from ..infrastructure.cache_provider import create_cache
+
+
+_SMALL = {"temp": 72.5, "weather": [{"description": "clear sky"}], "alerts": []}
+# Bigger than diskcache's default min_file_size (32 KiB), so it is stored as a separate file.
+_LARGE = {"summary": "x" * (64 * 1024), "hourly": list(range(100))}
+
+
+@pytest.mark.parametrize("value", [_SMALL, _LARGE], ids=["inline", "file"])
+def test_round_trips_json_values(tmp_path, value):
+    """Values come back equal whether stored inline in SQLite or in a value file."""
+    cache = create_cache(tmp_path)
+    cache.set("key", value)
+    assert cache.get("key") == value
+
+
+def test_reads_entries_pickled_by_plain_diskcache(tmp_path):
+    """Entries written before the orjson switch still load through create_cache."""
+    legacy = diskcache.Cache(tmp_path)
+    legacy.set("small", _SMALL)
+    legacy.set("large", _LARGE)
+    legacy.close()
+
+    cache = create_cache(tmp_path)
+    assert cache.get("small") == _SMALL
+    assert cache.get("large") == _LARGE
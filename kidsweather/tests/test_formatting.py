@@ -0,0 +1,36 @@
+"""Tests for the weather formatting helpers."""
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from ..formatting.weather import _day_name, _format_clock, extract_display_data
+
+_MIDNIGHT_UTC = 1704067200  # 2024-01-01 00:00 UTC, a Monday
+
+
+@pytest.mark.parametrize(
+    "timestamp, tz_offset",
+    [
+        (_MIDNIGHT_UTC, 0),  # midnight
+        (_MIDNIGHT_UTC + 12 * 3600, 0),  # noon
+        (_MIDNIGHT_UTC - 60, 0),  # 11:59 PM the day before
+        (_MIDNIGHT_UTC + 13 * 3600 + 15 * 60, 20700),  # +05:45 lands on 7:00 PM
+        (_MIDNIGHT_UTC + 30 * 60, -18000),  # crosses back to the previous day
+    ],
+)
+def test_clock_and_day_name_match_strftime(timestamp, tz_offset):
+    """The integer-maths helpers agree with strftime on the offset-adjusted time."""
+    local = datetime.fromtimestamp(timestamp, tz=timezone.utc) + timedelta(seconds=tz_offset)
+    assert _format_clock(timestamp, tz_offset) == local.strftime("%I:%M %p")
+    assert _day_name(timestamp, tz_offset) == local.strftime("%A")
+
+
+def test_display_day_names_use_forecast_offset():
+    """Day names follow the forecast's timezone, not the host's."""
+    weather_data = {
+        "timezone_offset": -18000,  # UTC-5
+        # 2024-01-01 00:30 UTC is a Monday in UTC but still Sunday evening at UTC-5.
+        "daily": [{"dt": 1704069000, "temp": {"max": 40.0, "min": 30.0}}],
+    }
+    display_data = extract_display_data(weather_data)
+    assert display_data["daily_forecast_raw"][0]["day"] == "Sunday"
@@ -1,15 +1,87 @@
 """Integration tests for the Kids Weather application."""
 import pytest
-import json
 from pathlib import Path
-from unittest.mock import Mock, patch
 
-from ..core.service import WeatherReportService, build_default_service
-from ..core.settings import load_settings
+import orjson
+import requests
+
+from ..clients.llm import LLMClient
+from ..clients.weather import WeatherClient
+from ..core.service import WeatherReportService
+from ..core.settings import AppSettings, load_settings
 from ..formatting.weather import format_for_llm, extract_display_data
+from ..infrastructure.cache_provider import create_cache
 from ..utils.file_utils import load_weather_data
 
 
+# Shared by every test; nothing mutates it, so it is built once at import time.
+_MOCK_WEATHER_DATA = {
+    "lat": 38.9,
+    "lon": -77.0,
+    "timezone": "America/New_York",
+    "timezone_offset": -18000,
+    "current": {
+        "dt": 1634567890,
+        "temp": 72.5,
+        "feels_like": 74.2,
+        "weather": [{"description": "clear sky", "main": "Clear"}],
+        "wind_speed": 5.2,
+        "uvi": 3.5,
+        "sunrise": 1634521200,
+        "sunset": 1634563200
+    },
+    "daily": [
+        {
+            "dt": 1634567890,
+            "temp": {"max": 78.0, "min": 65.0},
+            "weather": [{"description": "clear sky", "main": "Clear"}],
+            "pop": 0.1,
+            "wind_speed": 5.2,
+            "summary": "Clear skies throughout the day"
+        }
+    ],
+    "hourly": [
+        {
+            "dt": 1634567890,
+            "temp": 72.5,
+            "weather": [{"description": "clear sky"}],
+            "pop": 0.0,
+            "uvi": 3.5
+        }
+    ]
+}
+
+
+def _make_settings(root: Path) -> AppSettings:
+    """Explicit settings rooted in a temp dir, so tests never touch the real cache or env."""
+    return AppSettings(
+        root_dir=root,
+        cache_dir=root / "cache",
+        prompt_dir=root / "prompts",
+        test_data_dir=root / "test_data",
+        llm_log_db=root / "llm_log.sqlite3",
+        weather_api_url="https://api.openweathermap.org/data/3.0/onecall",
+        weather_timemachine_url="https://api.openweathermap.org/data/3.0/onecall/timemachine",
+        weather_units="imperial",
+        weather_cache_ttl_seconds=600,
+        weather_api_key="test_key",
+        llm_api_url="http://test.com",
+        llm_api_key="test",
+        llm_model="test",
+        llm_supports_json_mode=True,
+    )
+
+
+class _FakeResponse:
+    """Minimal stand-in for requests.Response; cheaper than building Mock objects."""
+
+    def __init__(self, payload):
+        self.content = orjson.dumps(payload)
+
+    def raise_for_status(self):
+        return None
+
+
 class TestWeatherServiceIntegration:
     """Integration tests for the weather service."""
 
@@ -21,30 +93,32 @@ class TestWeatherServiceIntegration:
         assert settings.default_lon == -77.0832061
         assert settings.default_location == "Washington, DC"
 
-    @patch('kidsweather.clients.weather.requests.get')
-    @patch('kidsweather.clients.llm.requests.post')
-    def test_build_report_with_mock_data(self, mock_llm_post, mock_weather_get):
+    def test_build_report_with_mock_data(self, monkeypatch, tmp_path):
         """Test building a weather report with mocked API responses."""
         # Mock weather API response
-        mock_weather_response = Mock()
-        mock_weather_response.json.return_value = self._get_mock_weather_data()
-        mock_weather_response.raise_for_status.return_value = None
-        mock_weather_get.return_value = mock_weather_response
+        weather_response = _FakeResponse(self._get_mock_weather_data())
+        monkeypatch.setattr(requests.Session, "get", lambda *args, **kwargs: weather_response)
 
         # Mock LLM response
-        mock_llm_response = Mock()
-        mock_llm_response.json.return_value = {
+        llm_response = _FakeResponse({
             "choices": [{
                 "message": {
                     "content": '{"description": "Sunny and warm day perfect for playing outside!", "daily_forecasts": {"Monday": "Great day for outdoor activities", "Tuesday": "Partly cloudy with mild temperatures"}}'
                 }
             }]
-        }
-        mock_llm_response.raise_for_status.return_value = None
-        mock_llm_post.return_value = mock_llm_response
-
-        # Build service and report
-        service = build_default_service()
+        })
+        monkeypatch.setattr(requests.Session, "post", lambda *args, **kwargs: llm_response)
+
+        # Build service and report against a throwaway cache and prompt dir
+        settings = _make_settings(tmp_path)
+        settings.prompt_dir.mkdir()
+        (settings.prompt_dir / "default.txt").write_text("You are a friendly weather reporter.")
+        cache = create_cache(settings.cache_dir)
+        service = WeatherReportService(
+            settings,
+            WeatherClient(settings, cache=cache),
+            LLMClient(settings, cache=cache),
+        )
         report = service.build_report(
             latitude=38.9,
             longitude=-77.0,
@@ -98,132 +172,42 @@ class TestWeatherServiceIntegration:
 
     def _get_mock_weather_data(self):
         """Get mock weather data for testing."""
-        return {
-            "lat": 38.9,
-            "lon": -77.0,
-            "timezone": "America/New_York",
-            "timezone_offset": -18000,
-            "current": {
-                "dt": 1634567890,
-                "temp": 72.5,
-                "feels_like": 74.2,
-                "weather": [{"description": "clear sky", "main": "Clear"}],
-                "wind_speed": 5.2,
-                "uvi": 3.5,
-                "sunrise": 1634521200,
-                "sunset": 1634563200
-            },
-            "daily": [
-                {
-                    "dt": 1634567890,
-                    "temp": {"max": 78.0, "min": 65.0},
-                    "weather": [{"description": "clear sky", "main": "Clear"}],
-                    "pop": 0.1,
-                    "wind_speed": 5.2,
-                    "summary": "Clear skies throughout the day"
-                }
-            ],
-            "hourly": [
-                {
-                    "dt": 1634567890,
-                    "temp": 72.5,
-                    "weather": [{"description": "clear sky"}],
-                    "pop": 0.0,
-                    "uvi": 3.5
-                }
-            ]
-        }
+        return _MOCK_WEATHER_DATA
 
 
 class TestWeatherClientIntegration:
     """Integration tests for weather client."""
 
-    @patch('kidsweather.clients.weather.requests.get')
-    def test_weather_client_caching(self, mock_get):
+    def test_weather_client_caching(self, monkeypatch, tmp_path):
         """Test that weather client properly handles caching."""
-        from ..clients.weather import WeatherClient
-        from ..core.settings import AppSettings
-        from pathlib import Path
-        import tempfile
-        import diskcache
-
-        # Create temporary cache directory
-        with tempfile.TemporaryDirectory() as temp_dir:
-            cache = diskcache.Cache(Path(temp_dir))
-
-            # Mock weather API response
-            mock_response = Mock()
-            mock_response.json.return_value = self._get_mock_weather_data()
-            mock_response.raise_for_status.return_value = None
-            mock_get.return_value = mock_response
-
-            # Create minimal settings for testing
-            settings = AppSettings(
-                root_dir=Path(temp_dir),
-                cache_dir=Path(temp_dir) / "cache",
-                prompt_dir=Path(temp_dir) / "prompts",
-                test_data_dir=Path(temp_dir) / "test_data",
-                llm_log_db=Path(temp_dir) / "llm_log.sqlite3",
-                weather_api_url="https://api.openweathermap.org/data/3.0/onecall",
-                weather_timemachine_url="https://api.openweathermap.org/data/3.0/onecall/timemachine",
-                weather_units="imperial",
-                weather_cache_ttl_seconds=600,
-                weather_api_key="test_key",
-                llm_api_url="http://test.com",
-                llm_api_key="test",
-                llm_model="test",
-                llm_supports_json_mode=True,
-            )
-            client = WeatherClient(settings, cache=cache)
-
-            # First call should hit API
-            result1 = client.fetch_current(38.9, -77.0)
-            assert mock_get.call_count == 1
-
-            # Second call should use cache
-            result2 = client.fetch_current(38.9, -77.0)
-            assert mock_get.call_count == 1  # No additional API calls
-
-            # Results should be identical
-            assert result1 == result2
+        settings = _make_settings(tmp_path)
+        cache = create_cache(settings.cache_dir)
+
+        # Mock weather API response, counting how often it is hit
+        response = _FakeResponse(self._get_mock_weather_data())
+        calls = []
+
+        def fake_get(*args, **kwargs):
+            calls.append(args)
+            return response
+
+        monkeypatch.setattr(requests.Session, "get", fake_get)
+        client = WeatherClient(settings, cache=cache)
+
+        # First call should hit API
+        result1 = client.fetch_current(38.9, -77.0)
+        assert len(calls) == 1
+
+        # Second call should use cache
+        result2 = client.fetch_current(38.9, -77.0)
+        assert len(calls) == 1  # No additional API calls
+
+        # Results should be identical
+        assert result1 == result2
 
     def _get_mock_weather_data(self):
         """Get mock weather data for testing."""
-        return {
-            "lat": 38.9,
-            "lon": -77.0,
-            "timezone": "America/New_York",
-            "timezone_offset": -18000,
-            "current": {
-                "dt": 1634567890,
-                "temp": 72.5,
-                "feels_like": 74.2,
-                "weather": [{"description": "clear sky", "main": "Clear"}],
-                "wind_speed": 5.2,
-                "uvi": 3.5,
-                "sunrise": 1634521200,
-                "sunset": 1634563200
-            },
-            "daily": [
-                {
-                    "dt": 1634567890,
-                    "temp": {"max": 78.0, "min": 65.0},
-                    "weather": [{"description": "clear sky", "main": "Clear"}],
-                    "pop": 0.1,
-                    "wind_speed": 5.2,
-                    "summary": "Clear skies throughout the day"
-                }
-            ],
-            "hourly": [
-                {
-                    "dt": 1634567890,
-                    "temp": 72.5,
-                    "weather": [{"description": "clear sky"}],
-                    "pop": 0.0,
-                    "uvi": 3.5
-                }
-            ]
-        }
+        return _MOCK_WEATHER_DATA
 
 
 if __name__ == "__main__":
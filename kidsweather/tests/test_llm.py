@@ -0,0 +1,24 @@
+"""Tests for LLM response post-processing."""
+import pytest
+
+from ..clients.llm import LLMClient
+
+_JSON = '{"description": "Sunny!"}'
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [
+        _JSON,
+        f"  {_JSON}\n",
+        f"temperature: {_JSON}",
+        f"```json\n{_JSON}\n```",
+        f"```\n{_JSON}\n```",
+        f"temperature: ```json\n{_JSON}\n```",
+        f"<think>Kids like sun.\nMaybe mention hats.</think>\n```json\n{_JSON}\n```",
+        f"<think>plan</think>{_JSON}",
+    ],
+    ids=["bare", "whitespace", "temperature", "json-fence", "plain-fence", "temperature-fence", "think-fence", "think-bare"],
+)
+def test_normalise_content_strips_wrappers(raw):
+    assert LLMClient._normalise_content(raw) == _JSON
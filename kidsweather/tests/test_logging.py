@@ -0,0 +1,64 @@
+"""Tests for the SQLite interaction logger's schema handling."""
+import sqlite3
+
+from ..infrastructure.logging import SCHEMA_VERSION, LLMInteractionLogger
+
+
+_LEGACY_SCHEMA = """
+CREATE TABLE llm_interactions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+    location_name TEXT,
+    weather_input TEXT,
+    system_prompt TEXT,
+    model_used TEXT,
+    llm_output TEXT,
+    description TEXT,
+    source TEXT
+)
+"""
+
+
+def _log_one(logger):
+    logger.ensure_schema()
+    logger.log(
+        weather_input={"current": {"temp": 70}},
+        llm_context="context",
+        system_prompt="prompt",
+        model_used="model",
+        llm_output={"description": "Nice"},
+        description="Nice",
+        source="test",
+    )
+
+
+def _inspect(path):
+    with sqlite3.connect(path) as conn:
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(llm_interactions)")}
+        (version,) = conn.execute("PRAGMA user_version").fetchone()
+        rows = conn.execute("SELECT llm_context, weather_input FROM llm_interactions").fetchall()
+    return columns, version, rows
+
+
+# Each test uses its own file: LLMInteractionLogger remembers verified paths for the whole process.
+def test_fresh_database_gets_current_schema(tmp_path):
+    path = tmp_path / "fresh.sqlite3"
+    _log_one(LLMInteractionLogger(path))
+
+    columns, version, rows = _inspect(path)
+    assert "llm_context" in columns
+    assert version == SCHEMA_VERSION == 1
+    assert rows == [("context", '{"current":{"temp":70}}')]
+
+
+def test_legacy_database_gains_llm_context(tmp_path):
+    path = tmp_path / "legacy.sqlite3"
+    with sqlite3.connect(path) as conn:
+        conn.execute(_LEGACY_SCHEMA)
+
+    _log_one(LLMInteractionLogger(path))
+
+    columns, version, rows = _inspect(path)
+    assert "llm_context" in columns
+    assert version == 1
+    assert rows == [("context", '{"current":{"temp":70}}')]
@@ -0,0 +1,33 @@
+"""Helpers for saving and loading raw weather fixtures."""
+from __future__ import annotations
+
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+import orjson
+
+from ..core.settings import load_settings
+
+
+def save_weather_data(data: dict, filename: Optional[str] = None, *, directory: Optional[Path] = None) -> Path:
+    """Persist raw weather data to disk for later replay or testing."""
+    # Only consult settings when no directory is given; load_settings() is memoised either way.
+    target_dir = directory or load_settings().test_data_dir
+    target_dir.mkdir(parents=True, exist_ok=True)
+
+    if not filename:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        filename = f"weather_{timestamp}.json"
+
+    path = target_dir / filename
+    # Fixtures stay indented so they remain easy to read and diff by hand.
+    path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    return path
+
+
+def load_weather_data(filename: str, *, directory: Optional[Path] = None) -> dict:
+    """Load weather data previously saved for deterministic runs."""
+    target_dir = directory or load_settings().test_data_dir
+    path = target_dir / filename
+    return orjson.loads(path.read_bytes())
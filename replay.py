@@ -6,18 +6,17 @@
 #     "requests",
 #     "python-dotenv",
 #     "click",
+#     "orjson",
 # ]
 # ///
 
-import json
 import sqlite3
 from datetime import datetime, timezone
 from pathlib import Path
 
 import click
-from dotenv import load_dotenv
+import orjson
 
-from kidsweather.clients.llm import LLMClient
 from kidsweather.core.settings import load_settings
 
 
@@ -60,14 +59,14 @@ def main(log_id, prompt, new_model, show_context):
     (timestamp_str, location_name, weather_input_json, llm_context, original_prompt, original_model, llm_output_json) = row
 
     try:
-        weather_input = json.loads(weather_input_json)
-    except json.JSONDecodeError as exc:
+        weather_input = orjson.loads(weather_input_json)
+    except orjson.JSONDecodeError as exc:
         raise click.ClickException(f"Could not decode stored weather input: {exc}")
 
     stored_output = None
     try:
-        stored_output = json.loads(llm_output_json)
-    except json.JSONDecodeError:
+        stored_output = orjson.loads(llm_output_json)
+    except orjson.JSONDecodeError:
         stored_output = {"raw_output": llm_output_json}
 
     llm_context = llm_context or ""
@@ -88,7 +87,10 @@ def main(log_id, prompt, new_model, show_context):
 
     click.echo(f"Using model for replay: {new_model or original_model}")
 
-    client = LLMClient(settings.primary_llm, settings.fallback_llm, cache=None)
+    # Imported here so `--help` and lookup errors don't pay for loading requests.
+    from kidsweather.clients.llm import LLMClient
+
+    client = LLMClient(settings, cache=None)
     new_output = client.generate(
         llm_context,
         prompt_material,
@@ -132,9 +134,8 @@ def _print_summary(
 
     click.echo("--- Replay Results ---")
     click.echo(f"Model Used: {new_output.get('_model_used')}")
-    click.echo(json.dumps(new_output, indent=2, ensure_ascii=False))
+    click.echo(orjson.dumps(new_output, option=orjson.OPT_INDENT_2).decode())
 
 
 if __name__ == '__main__':
-    load_dotenv()
     main()